@@ -4,7 +4,7 @@ Features:
 - Input product keyword
 - Scrape search result pages (basic, polite)
 - Preview scraped table
-- Download CSV / Excel
+- Download CSV / Parquet / Excel
 - Basic analytics: counts, rating distribution, price distribution, scatter price vs rating
 
 USAGE:
@@ -13,13 +13,17 @@ USAGE:
 WARNING: polite scraping only. Respect site's terms and set low num_pages/delay.
 """
 from typing import List, Dict, Optional, Tuple
-import time
+import asyncio
 import io
 import math
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 
-import requests
+import aiohttp
+from aiohttp_client_cache import CachedSession, SQLiteBackend
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 import pandas as pd
 import numpy as np
 import streamlit as st
@@ -33,6 +37,38 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
                   "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/107.0.0.0 Safari/537.36"
 }
+# max number of result pages fetched at the same time (politeness)
+MAX_CONCURRENT_REQUESTS = 5
+REQUEST_TIMEOUT_SEC = 15
+# on-disk HTTP cache for result pages (shared across reruns and sessions)
+HTTP_CACHE_NAME = ".amz_cache"
+HTTP_CACHE_EXPIRE_SEC = 1800
+# number of bars in the price distribution chart
+PRICE_HIST_BINS = 30
+
+# ---------------------- Parsing patterns ----------------------
+# first number in the text (used with Series.str.extract, so one capture group)
+_PRICE_PATTERN = r"(\d*\.\d+|\d+)"
+_RATING_PATTERN = r"(\d+\.\d+|\d+)"
+
+def _has_class(name: str) -> str:
+    """XPath predicate: element's class list contains `name` (like BS4's class matching)."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# Precompiled XPath expressions mirroring extract_from_block (evaluated in C by lxml)
+_XP_RESULT_BLOCKS = etree.XPath('//div[@data-component-type="s-search-result"]')
+_XP_TITLE_SPAN = etree.XPath("string((.//h2)[1]/descendant::span[1])")
+_XP_TITLE_H2 = etree.XPath("string((.//h2)[1])")
+_XP_TITLE_LINK = etree.XPath('string((.//a[@class="a-link-normal a-text-normal"])[1])')
+_XP_HREF = etree.XPath("(.//a[@href])[1]/@href")
+_XP_PRICE = etree.XPath(f"string((.//span[{_has_class('a-price')}])[1]/descendant::span[{_has_class('a-offscreen')}][1])")
+_XP_PRICE_FALLBACK = etree.XPath(f"string((.//span[{_has_class('a-color-base')}])[1])")
+_XP_RATING = etree.XPath(f"string((.//span[{_has_class('a-icon-alt')}])[1])")
+_XP_ARIA_LABEL = etree.XPath("(.//*[@aria-label])[1]/@aria-label")
+_XP_AUTHOR_ROW = etree.XPath('(.//div[@class="a-row a-size-base a-color-secondary"])[1]')
+_XP_AUTHOR_LINK = etree.XPath("string(descendant::a[1])")
+# leaf spans only, tested on their own text (like BS4's find("span", string=...))
+_XP_BYLINE = etree.XPath("string((.//span[not(*)][contains(translate(text(), 'BY', 'by'), 'by ')])[1])")
 
 # ---------------------- Helper functions ----------------------
 def safe_text(elem) -> Optional[str]:
@@ -40,50 +76,30 @@ def safe_text(elem) -> Optional[str]:
         return None
     return elem.get_text(strip=True)
 
-def parse_price(price_text: Optional[str]) -> Optional[float]:
-    """Try to convert price string like '$12.34' or 'USD 12.34' to float."""
-    if not price_text:
-        return None
-    # remove common currency symbols/labels
-    cleaned = price_text.replace(',', '').replace('USD', '').replace('US$', '')
-    # keep digits and dot and minus
-    chars = []
-    for ch in cleaned:
-        if ch.isdigit() or ch == '.':
-            chars.append(ch)
-    s = ''.join(chars)
-    try:
-        return float(s) if s else None
-    except:
-        return None
+def parse_prices(price_text: pd.Series) -> pd.Series:
+    """Vectorized: convert price strings like '$12.34' or 'USD 1,234.50' to float (NaN if none)."""
+    # drop thousands separators, then take the first number
+    cleaned = price_text.str.replace(",", "", regex=False)
+    return cleaned.str.extract(_PRICE_PATTERN, expand=False).astype(float)
 
-def parse_rating(rating_text: Optional[str]) -> Optional[float]:
-    """Parse rating like '4.5 out of 5 stars' -> 4.5"""
-    if not rating_text:
-        return None
-    parts = rating_text.strip().split()
-    for token in parts:
-        try:
-            val = float(token)
-            return val
-        except:
-            continue
-    return None
+def parse_ratings(rating_text: pd.Series) -> pd.Series:
+    """Vectorized: parse ratings like '4.5 out of 5 stars' -> 4.5 (NaN if none)."""
+    return rating_text.str.extract(_RATING_PATTERN, expand=False).astype(float)
 
 def find_product_blocks(soup: BeautifulSoup) -> List[BeautifulSoup]:
     """
     Try a few common selectors for Amazon-like search results.
     """
     # Prefer the stable 'data-component-type="s-search-result"'
-    blocks = soup.find_all("div", {"data-component-type": "s-search-result"})
+    blocks = soup.select('div[data-component-type="s-search-result"]')
     if blocks:
         return blocks
     # fallback to other known container classes (less reliable)
     blocks = soup.find_all("div", {"class": "a-section a-spacing-medium"})
     if blocks:
         return blocks
-    # final fallback: any 'div' with 'data-asin' attribute
-    blocks = [d for d in soup.find_all("div") if d.get("data-asin")]
+    # final fallback: any 'div' with a non-empty 'data-asin' attribute
+    blocks = soup.select('div[data-asin]:not([data-asin=""])')
     return blocks
 
 def extract_from_block(block) -> Dict:
@@ -146,19 +162,123 @@ def extract_from_block(block) -> Dict:
         "title": title,
         "link": link,
         "price_raw": price,
-        "price": parse_price(price),
         "rating_raw": rating_text,
-        "rating": parse_rating(rating_text),
         "author": author,
     }
 
+def _xp_text(value: str) -> Optional[str]:
+    """Whitespace-normalized XPath string() result, None if empty."""
+    return " ".join(value.split()) or None
+
+def extract_from_element(block) -> Dict:
+    """lxml counterpart of extract_from_block: same fields, via precompiled XPath."""
+    title = _xp_text(_XP_TITLE_SPAN(block)) or _xp_text(_XP_TITLE_H2(block)) or _xp_text(_XP_TITLE_LINK(block))
+
+    hrefs = _XP_HREF(block)
+    link = "https://www.amazon.com" + hrefs[0] if hrefs else None
+
+    price = _xp_text(_XP_PRICE(block)) or _xp_text(_XP_PRICE_FALLBACK(block))
+
+    rating_text = _xp_text(_XP_RATING(block))
+    if not rating_text:
+        aria = _XP_ARIA_LABEL(block)
+        if aria and "out of 5 stars" in aria[0]:
+            rating_text = aria[0]
+
+    author = None
+    author_rows = _XP_AUTHOR_ROW(block)
+    if author_rows:
+        author = _xp_text(_XP_AUTHOR_LINK(author_rows[0])) or _xp_text(author_rows[0].text_content())
+    if not author:
+        author = _xp_text(_XP_BYLINE(block))
+
+    return {
+        "title": title,
+        "link": link,
+        "price_raw": price,
+        "rating_raw": rating_text,
+        "author": author,
+    }
+
+def extract_page(content: str) -> List[Dict]:
+    """
+    Extract product dicts from one result page.
+    Fast path: lxml + XPath on 's-search-result' blocks. If none are found,
+    fall back to BeautifulSoup and the looser selectors in find_product_blocks.
+    """
+    try:
+        blocks = _XP_RESULT_BLOCKS(lxml_html.fromstring(content))
+    except (etree.ParserError, ValueError):
+        # empty document, or an XML encoding declaration (not accepted on str input)
+        blocks = []
+    if blocks:
+        return [extract_from_element(b) for b in blocks]
+    soup = BeautifulSoup(content, "lxml")
+    return [extract_from_block(b) for b in find_product_blocks(soup)]
+
 # ---------------------- Scraper core ----------------------
+def _http_cache() -> SQLiteBackend:
+    return SQLiteBackend(HTTP_CACHE_NAME, expire_after=HTTP_CACHE_EXPIRE_SEC)
+
+async def _fetch_page(session: aiohttp.ClientSession, url: str, sem: asyncio.Semaphore, start_delay: float, logger: logging.Logger) -> Optional[str]:
+    """
+    Fetch one search page after `start_delay` seconds.
+    Returns the HTML decoded with the response charset, or None on failure / non-200.
+    """
+    # politeness: network request starts are staggered by the configured delay
+    await asyncio.sleep(start_delay)
+    async with sem:
+        logger.info(f"Requesting {url}")
+        try:
+            timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SEC)
+            async with session.get(url, headers=HEADERS, timeout=timeout) as resp:
+                logger.info(f"Status: {resp.status}")
+                if resp.status != 200:
+                    logger.error(f"Non-200 status code: {resp.status} for {url}")
+                    return None
+                if getattr(resp, "from_cache", False):
+                    logger.info(f"Served from cache: {url}")
+                return await resp.text(errors="replace")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Request failed: {e}")
+            return None
+
+async def _fetch_pages(urls: List[str], sleep_sec: float, logger: logging.Logger) -> List[Optional[str]]:
+    """
+    Fetch all `urls` concurrently (bounded by MAX_CONCURRENT_REQUESTS), results in url order.
+    Responses are cached on disk for HTTP_CACHE_EXPIRE_SEC. Pages already in the cache
+    are read right away; the k-th page that needs the network starts k * sleep_sec after
+    the first one, so network requests overlap in flight but never start closer together
+    than the delay.
+    """
+    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    async with CachedSession(cache=_http_cache()) as session:
+        start_delays = []
+        n_network = 0
+        for url in urls:
+            cached = await session.cache.get_response(session.cache.create_key("GET", url))
+            if cached is not None:
+                start_delays.append(0.0)
+            else:
+                start_delays.append(n_network * sleep_sec)
+                n_network += 1
+        return await asyncio.gather(*[
+            _fetch_page(session, u, sem, delay, logger) for u, delay in zip(urls, start_delays)
+        ])
+
+async def _evict_pages(urls: List[str]) -> None:
+    """Drop `urls` from the HTTP cache (e.g. robot-check pages that came back 200 without products)."""
+    async with CachedSession(cache=_http_cache()) as session:
+        for url in urls:
+            await session.cache.delete_url(url)
+
 def scrape_amazon_search(keyword: str, max_pages: int = 2, sleep_sec: float = 1.0, max_items: Optional[int] = None, logger: Optional[logging.Logger]=None) -> List[Dict]:
     """
     Scrape Amazon search result pages for `keyword`.
     - max_pages: how many result pages to crawl (keep small e.g., 1-3)
-    - sleep_sec: delay between page requests (politeness)
+    - sleep_sec: delay between the starts of consecutive page requests (politeness)
     - max_items: optional cap on total items to collect
+    Pages are downloaded concurrently and parsed in a thread pool; results are merged in page order.
     Returns list of product dicts.
     """
     if logger is None:
@@ -166,49 +286,125 @@ def scrape_amazon_search(keyword: str, max_pages: int = 2, sleep_sec: float = 1.
     items = []
     seen = set()
     base_query = keyword.strip().replace(" ", "+")
-    page = 1
-    while page <= max_pages:
-        url = f"https://www.amazon.com/s?k={base_query}&page={page}"
-        logger.info(f"Requesting {url}")
-        try:
-            resp = requests.get(url, headers=HEADERS, timeout=15)
-        except requests.RequestException as e:
-            logger.error(f"Request failed: {e}")
+    urls = [f"https://www.amazon.com/s?k={base_query}&page={page}" for page in range(1, max_pages + 1)]
+    pages = asyncio.run(_fetch_pages(urls, sleep_sec, logger))
+
+    # only pages before the first failed one are used
+    fetched = []
+    for page, content in enumerate(pages, start=1):
+        if content is None:
+            logger.error(f"Page {page} could not be fetched. Stopping.")
             break
+        fetched.append(content)
 
-        logger.info(f"Status: {resp.status_code}")
-        if resp.status_code != 200:
-            logger.error(f"Non-200 status code: {resp.status_code}. Stopping.")
-            break
+    # parse pages in parallel (lxml releases the GIL while parsing), merge in page order below
+    per_page = []
+    if fetched:
+        with ThreadPoolExecutor(max_workers=min(len(fetched), os.cpu_count() or 1)) as executor:
+            per_page = list(executor.map(extract_page, fetched))
+    # a page without products is a block / robot check: don't replay it from the cache
+    empty_urls = [url for url, page_items in zip(urls, per_page) if not page_items]
+    if empty_urls:
+        asyncio.run(_evict_pages(empty_urls))
 
-        soup = BeautifulSoup(resp.content, "html.parser")
-        blocks = find_product_blocks(soup)
-        logger.info(f"Found {len(blocks)} blocks on page {page}")
+    for page, page_items in enumerate(per_page, start=1):
+        logger.info(f"Found {len(page_items)} blocks on page {page}")
 
         found_this_page = 0
-        for b in blocks:
-            data = extract_from_block(b)
-            if not data.get("title"):
+        for data in page_items:
+            title = data.get("title")
+            if not title:
                 continue
-            title = data["title"]
-            if title in seen:
+            # normalize whitespace/case so near-identical titles count as duplicates
+            key = " ".join(title.split()).lower()
+            if key in seen:
                 continue
-            seen.add(title)
+            seen.add(key)
             items.append(data)
             found_this_page += 1
             if max_items and len(items) >= max_items:
                 break
         logger.info(f"Added {found_this_page} new items from page {page} (total={len(items)})")
-        # politeness
-        time.sleep(sleep_sec)
         if max_items and len(items) >= max_items:
             break
         # break early if no results
         if found_this_page == 0:
             break
-        page += 1
     return items
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def scrape_amazon_search_cached(keyword: str, max_pages: int, max_items: Optional[int], _sleep_sec: float = 1.0, _logger: Optional[logging.Logger]=None) -> List[Dict]:
+    """
+    Memoized scrape_amazon_search, keyed on (keyword, max_pages, max_items) for 1 hour.
+    Delay and logger are underscore-prefixed so they are not part of the cache key.
+    """
+    return scrape_amazon_search(
+        keyword=keyword,
+        max_pages=max_pages,
+        sleep_sec=_sleep_sec,
+        max_items=max_items,
+        logger=_logger
+    )
+
+def df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize `df` to UTF-8 CSV bytes."""
+    return df.to_csv(index=False).encode("utf-8")
+
+def df_to_parquet_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize `df` to an in-memory zstd-compressed Parquet file."""
+    buf = io.BytesIO()
+    df.to_parquet(buf, engine="pyarrow", compression="zstd", index=False)
+    return buf.getvalue()
+
+def df_to_excel_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize `df` to an in-memory .xlsx file."""
+    towrite = io.BytesIO()
+    with pd.ExcelWriter(towrite, engine="xlsxwriter") as writer:
+        df.to_excel(writer, index=False, sheet_name="scraped")
+    return towrite.getvalue()
+
+def price_histogram(prices: np.ndarray, bins: int = PRICE_HIST_BINS) -> pd.Series:
+    """
+    Bucket prices into equal-width bins; counts indexed by the bin's centre.
+    Uses at most one bin per distinct price, and the labels are left unrounded so
+    narrow price spreads don't give several bins the same label.
+    """
+    bins = max(1, min(bins, len(np.unique(prices))))
+    counts, edges = np.histogram(prices, bins=bins)
+    centres = (edges[:-1] + edges[1:]) / 2
+    return pd.Series(counts, index=pd.Index(centres, name="Price"), name="count")
+
+@st.cache_data(show_spinner=False)
+def compute_analytics(df: pd.DataFrame) -> Dict:
+    """
+    All numbers/series shown in the analytics section, computed once per scraped table.
+    Cached on the DataFrame content so widget reruns don't redo the work.
+    """
+    # pull the numeric columns out once; everything below works on plain arrays + masks
+    price_arr = df["Price"].to_numpy(dtype=float)
+    rating_arr = df["Rating"].to_numpy(dtype=float)
+    has_price = ~np.isnan(price_arr)
+    has_rating = ~np.isnan(rating_arr)
+    prices = price_arr[has_price]
+    ratings = rating_arr[has_rating]
+    rating_values, rating_counts = np.unique(ratings, return_counts=True)
+
+    top_authors = None
+    if "Author" in df.columns and df["Author"].notna().any():
+        top_authors = df["Author"].value_counts(dropna=False).head(10)
+        top_authors.index = top_authors.index.astype(object).fillna("Unknown")
+    return {
+        "n_items": len(df),
+        "n_with_price": int(has_price.sum()),
+        "n_with_rating": int(has_rating.sum()),
+        "avg_price": float(prices.mean()) if prices.size else math.nan,
+        "price_hist": price_histogram(prices),
+        "prices": pd.Series(prices, name="Price"),
+        "rating_counts": pd.Series(rating_counts, index=pd.Index(rating_values, name="Rating"), name="count"),
+        "scatter_df": df[has_price & has_rating],
+        "top_authors": top_authors,
+    }
+
 # ---------------------- Streamlit UI ----------------------
 st.set_page_config(page_title="Amazon-style Scraper (Demo)", layout="wide")
 st.title("Amazon-style Scraper — Demo")
@@ -237,22 +433,30 @@ if run_btn and keyword.strip():
 
     # show simple progress UI
     with st.spinner("Scraping... this may take a few seconds per page"):
+        scrape_args = dict(
+            keyword=keyword.strip(),
+            max_pages=max_pages,
+            max_items=(None if max_items == 0 else int(max_items)),
+            _sleep_sec=delay,
+            _logger=logger
+        )
         try:
-            items = scrape_amazon_search(
-                keyword=keyword,
-                max_pages=max_pages,
-                sleep_sec=delay,
-                max_items=(None if max_items == 0 else int(max_items)),
-                logger=logger
-            )
+            items = scrape_amazon_search_cached(**scrape_args)
         except Exception as e:
             st.error(f"Scraper error: {e}")
             items = []
+        if not items:
+            # don't keep this empty (blocked / failed) result around for the whole TTL
+            scrape_amazon_search_cached.clear(**scrape_args)
 
     if not items:
         st.warning("No items collected. Mungkin struktur halaman berubah atau tidak ada hasil.")
+        st.session_state.pop("results_df", None)
     else:
         df = pd.DataFrame(items)
+        # parse numeric columns in one pass over the whole table
+        df["price"] = parse_prices(df["price_raw"])
+        df["rating"] = parse_ratings(df["rating_raw"])
         # standardize columns
         df = df[["title", "author", "price_raw", "price", "rating_raw", "rating", "link"]]
         df = df.rename(columns={
@@ -264,81 +468,93 @@ if run_btn and keyword.strip():
             "rating": "Rating",
             "link": "Link"
         })
+        # compact dtypes: Arrow-backed strings, repeated authors stored once as categories
+        text_cols = ["Title", "Price (raw)", "Rating (raw)", "Link"]
+        df[text_cols] = df[text_cols].astype("string[pyarrow]")
+        df["Author"] = df["Author"].astype("category")
+        # keep results across reruns (e.g. the one triggered by a download click)
+        st.session_state["results_df"] = df
+
+df = st.session_state.get("results_df")
+if df is not None:
+    st.subheader("Preview scraped data")
+    st.dataframe(df, use_container_width=True)
+
+    # Download buttons: files are serialized only when the button is clicked
+    st.download_button(
+        "Download CSV",
+        lambda: df_to_csv_bytes(df),
+        file_name="scraped_products.csv",
+        mime="text/csv"
+    )
+    st.download_button(
+        "Download Parquet",
+        lambda: df_to_parquet_bytes(df),
+        file_name="scraped_products.parquet",
+        mime="application/octet-stream"
+    )
+    st.download_button(
+        "Download Excel (.xlsx)",
+        lambda: df_to_excel_bytes(df),
+        file_name="scraped_products.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    )
+    # ---------------- Analytics ----------------
+    st.subheader("Statistics & Trends")
+
+    stats = compute_analytics(df)
+    n_items = stats["n_items"]
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total items", f"{n_items}")
+        n_with_price = stats["n_with_price"]
+        st.metric("Items with parsed price", f"{n_with_price} ({n_with_price/n_items*100:.1f}%)")
+    with col2:
+        n_with_rating = stats["n_with_rating"]
+        st.metric("Items with rating", f"{n_with_rating} ({n_with_rating/n_items*100:.1f}%)")
+    with col3:
+        avg_price = stats["avg_price"]
+        st.metric("Average price (parsed)", f"{avg_price:.2f}" if not math.isnan(avg_price) else "N/A")
+
+    # Price distribution
+    st.markdown("**Price distribution (parsed)**")
+    if not stats["prices"].empty:
+        st.bar_chart(stats["price_hist"])
+        st.line_chart(stats["prices"])
+    else:
+        st.info("Tidak ada data harga yang berhasil diparsing.")
 
-        st.subheader("Preview scraped data")
-        st.dataframe(df, use_container_width=True)
-
-        # Download buttons
-        csv_bytes = df.to_csv(index=False).encode("utf-8")
-        st.download_button("Download CSV", csv_bytes, file_name="scraped_products.csv", mime="text/csv")
+    # Rating distribution
+    st.markdown("**Rating distribution**")
+    if not stats["rating_counts"].empty:
+        st.bar_chart(stats["rating_counts"])
+    else:
+        st.info("Tidak ada data rating yang berhasil diparsing.")
+
+    # Scatter price vs rating
+    st.markdown("**Price vs Rating (scatter)**")
+    scatter_df = stats["scatter_df"]
+    if not scatter_df.empty:
+        st.altair_chart(
+            __import__("altair").Chart(scatter_df).mark_circle(size=60).encode(
+                x="Price",
+                y="Rating",
+                tooltip=["Title", "Author", "Price", "Rating"]
+            ).interactive().properties(height=400),
+            use_container_width=True
+        )
+    else:
+        st.info("Butuh minimal satu item dengan price & rating untuk scatter plot.")
 
-        # Excel
-        towrite = io.BytesIO()
-        with pd.ExcelWriter(towrite, engine="xlsxwriter") as writer:
-            df.to_excel(writer, index=False, sheet_name="scraped")
-        towrite.seek(0)
+    # Top authors
+    st.markdown("**Top authors / sellers (by count)**")
+    top_auth = stats["top_authors"]
+    if top_auth is not None:
+        st.table(top_auth.reset_index().rename(columns={"index": "Author", "Author": "Count"}))
+    else:
+        st.info("Tidak ada informasi author yang berhasil diekstrak.")
 
-        st.download_button(
-            "Download Excel (.xlsx)",
-            towrite.read(),
-            file_name="scraped_products.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-        )
-        # ---------------- Analytics ----------------
-        st.subheader("Statistics & Trends")
-
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Total items", f"{len(df)}")
-            n_with_price = df["Price"].count()
-            st.metric("Items with parsed price", f"{n_with_price} ({n_with_price/len(df)*100:.1f}%)")
-        with col2:
-            n_with_rating = df["Rating"].count()
-            st.metric("Items with rating", f"{n_with_rating} ({n_with_rating/len(df)*100:.1f}%)")
-        with col3:
-            avg_price = df["Price"].dropna().mean()
-            st.metric("Average price (parsed)", f"{avg_price:.2f}" if not math.isnan(avg_price) else "N/A")
-
-        # Price distribution
-        st.markdown("**Price distribution (parsed)**")
-        price_df = df[["Title", "Price"]].dropna()
-        if not price_df.empty:
-            st.bar_chart(price_df["Price"].astype(float).round(2).value_counts().sort_index())
-            st.line_chart(price_df["Price"].astype(float).reset_index(drop=True))
-        else:
-            st.info("Tidak ada data harga yang berhasil diparsing.")
-
-        # Rating distribution
-        st.markdown("**Rating distribution**")
-        rating_df = df[["Title", "Rating"]].dropna()
-        if not rating_df.empty:
-            st.bar_chart(rating_df["Rating"].value_counts().sort_index())
-        else:
-            st.info("Tidak ada data rating yang berhasil diparsing.")
-
-        # Scatter price vs rating
-        st.markdown("**Price vs Rating (scatter)**")
-        scatter_df = df.dropna(subset=["Price", "Rating"])
-        if not scatter_df.empty:
-            st.altair_chart(
-                __import__("altair").Chart(scatter_df).mark_circle(size=60).encode(
-                    x="Price",
-                    y="Rating",
-                    tooltip=["Title", "Author", "Price", "Rating"]
-                ).interactive().properties(height=400),
-                use_container_width=True
-            )
-        else:
-            st.info("Butuh minimal satu item dengan price & rating untuk scatter plot.")
-
-        # Top authors
-        st.markdown("**Top authors / sellers (by count)**")
-        if "Author" in df.columns and df["Author"].notna().any():
-            top_auth = df["Author"].fillna("Unknown").value_counts().head(10)
-            st.table(top_auth.reset_index().rename(columns={"index": "Author", "Author": "Count"}))
-        else:
-            st.info("Tidak ada informasi author yang berhasil diekstrak.")
-
-        st.success("Selesai — ingat untuk menggunakan scraper ini dengan etika.")
-else:
+    st.success("Selesai — ingat untuk menggunakan scraper ini dengan etika.")
+elif not (run_btn and keyword.strip()):
     st.info("Masukkan keyword dan tekan *Start scraping* untuk memulai (demo: 'data science books').")
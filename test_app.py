@@ -9,9 +9,7 @@ Features:
 - Download filtered data as CSV
 """
 
-import io
-import base64
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -24,29 +22,58 @@ st.set_page_config(page_title="Simple Streamlit Demo", layout="wide")
 @st.cache_data
 def load_sample_data(n=200) -> pd.DataFrame:
     rng = np.random.default_rng(42)
-    x = rng.normal(loc=50, scale=15, size=n)
-    noise = rng.normal(scale=8, size=n)
+    # one (n, 2) block: column 0 -> x, column 1 -> noise turned into y in place
+    arr = rng.standard_normal(size=(n, 2))
+    arr[:, 0] *= 15
+    arr[:, 0] += 50
     # simple relation y = 0.7*x + 10 + noise
-    y = 0.7 * x + 10 + noise
-    cat = rng.choice(["A", "B", "C"], size=n)
-    df = pd.DataFrame({"x": x.round(2), "y": y.round(2), "category": cat})
-    df["id"] = np.arange(1, n + 1)
-    return df[["id", "x", "y", "category"]]
+    arr[:, 1] *= 8
+    arr[:, 1] += 0.7 * arr[:, 0] + 10
+    np.round(arr, 2, out=arr)
+    df = pd.DataFrame(arr, columns=["x", "y"])
+    df["category"] = rng.choice(np.array(["A", "B", "C"]), size=n)
+    df.insert(0, "id", np.arange(1, n + 1, dtype=np.int32))
+    return df
 
 def compute_trendline(x: np.ndarray, y: np.ndarray) -> Tuple[float, float]:
-    # returns slope, intercept
-    slope, intercept = np.polyfit(x, y, 1)
+    # returns slope, intercept (closed-form least squares: cov(x, y) / var(x))
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    # ignore rows with a missing/inf value in either column (e.g. blanks in an uploaded CSV)
+    finite = np.isfinite(x) & np.isfinite(y)
+    x, y = x[finite], y[finite]
+    if x.size < 2:
+        raise ValueError("butuh minimal 2 titik data")
+    x_mean = x.mean()
+    y_mean = y.mean()
+    dx = x - x_mean
+    sxx = np.dot(dx, dx)
+    if sxx == 0:
+        raise ValueError("semua nilai X sama, slope tidak terdefinisi")
+    slope = np.dot(dx, y - y_mean) / sxx
+    intercept = y_mean - slope * x_mean
     return slope, intercept
 
+def filter_and_fit(
+    df: pd.DataFrame, x_col: str, y_col: str, lo: float, hi: float
+) -> Tuple[pd.DataFrame, Optional[Tuple[float, float]], Optional[str]]:
+    """
+    Filter rows to lo <= x <= hi and fit the trendline on them.
+    Not cached: a mask plus two dot products is cheaper than hashing/pickling the frame.
+    Returns (filtered frame, (slope, intercept) or None, error message or None).
+    """
+    df_filtered = df[(df[x_col] >= lo) & (df[x_col] <= hi)]
+    try:
+        slope, intercept = compute_trendline(df_filtered[x_col].to_numpy(), df_filtered[y_col].to_numpy())
+    except Exception as e:
+        return df_filtered, None, str(e)
+    return df_filtered, (float(slope), float(intercept)), None
+
+@st.cache_data(show_spinner=False)
 def df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    # cached on the (filtered) table, so unrelated widget reruns don't re-serialize it
     return df.to_csv(index=False).encode("utf-8")
 
-def get_download_link(df: pd.DataFrame, filename="data.csv") -> str:
-    b = df_to_csv_bytes(df)
-    b64 = base64.b64encode(b).decode()
-    href = f"data:file/csv;base64,{b64}"
-    return href
-
 # ---- Sidebar ----
 st.sidebar.title("Controls")
 source = st.sidebar.radio("Data source", ("Sample data", "Upload CSV"))
@@ -105,7 +132,7 @@ else:
     st.markdown("**Filter baris berdasarkan rentang X**")
     min_x, max_x = float(df[x_col].min()), float(df[x_col].max())
     range_sel = st.slider("X range", min_value=min_x, max_value=max_x, value=(min_x, max_x))
-    df_filtered = df[(df[x_col] >= range_sel[0]) & (df[x_col] <= range_sel[1])]
+    df_filtered, trend, trend_error = filter_and_fit(df, x_col, y_col, range_sel[0], range_sel[1])
 
     st.write(f"Menampilkan {len(df_filtered)} baris setelah filter.")
 
@@ -118,21 +145,21 @@ else:
     if color_col:
         base = base.encode(color=color_col)
 
-    # trendline calculation
-    try:
-        slope, intercept = compute_trendline(df_filtered[x_col].to_numpy(), df_filtered[y_col].to_numpy())
+    if trend is not None:
+        slope, intercept = trend
         # create trendline data
         x_vals = np.array([df_filtered[x_col].min(), df_filtered[x_col].max()])
         y_vals = slope * x_vals + intercept
         trend_df = pd.DataFrame({x_col: x_vals, y_col: y_vals})
-        trend = alt.Chart(trend_df).mark_line().encode(x=x_col, y=y_col)
-        chart = (base + trend).interactive().properties(height=450)
-    except Exception as e:
-        st.warning(f"Gagal menghitung trendline: {e}")
+        trend_line = alt.Chart(trend_df).mark_line().encode(x=x_col, y=y_col)
+        chart = (base + trend_line).interactive().properties(height=450)
+    else:
+        st.warning(f"Gagal menghitung trendline: {trend_error}")
         chart = base.interactive().properties(height=450)
 
     st.altair_chart(chart, use_container_width=True)
-    st.markdown(f"Trendline: slope = **{slope:.4f}**, intercept = **{intercept:.4f}**")
+    if trend is not None:
+        st.markdown(f"Trendline: slope = **{slope:.4f}**, intercept = **{intercept:.4f}**")
 
 # ---- Simple row filter by category (if exists) ----
 if cat_cols: